@@ -4,6 +4,10 @@ from datetime import datetime, timedelta, date
 import os
 import sys
 import json
+import glob
+import webbrowser
+from contextlib import redirect_stdout
+from io import StringIO
 from typing import Dict, List, Optional
 
 # Add the project root to Python path if not already there
@@ -19,8 +23,10 @@ from src.tasks import (
     create_task,
     generate_unique_id,
     validate_task,
+    parse_due_date,
 )
 import subprocess
+import pytest
 
 # Constants for category management
 CATEGORIES_FILE = "categories.json"
@@ -30,19 +36,31 @@ DEFAULT_CATEGORIES = ["Work", "Personal", "School", "Other"]
 PRIORITY_COLORS = {"High": "red", "Medium": "orange", "Low": "green"}
 
 
+# Each save changes the file's key, so keep only the latest few entries
+_CATEGORIES_CACHE_ENTRIES = 4
+
+
+@st.cache_data(show_spinner=False, max_entries=_CATEGORIES_CACHE_ENTRIES)
+def _load_categories_cached(path, mtime_ns, size):
+    """Read categories from path; cached per (path, mtime, size) by Streamlit."""
+    with open(path, "r") as f:
+        return json.load(f)
+
+
 def load_categories():
     """Load categories from file or return default categories"""
     try:
-        with open(CATEGORIES_FILE, "r") as f:
-            return json.load(f)
+        stat = os.stat(CATEGORIES_FILE)
+        return _load_categories_cached(CATEGORIES_FILE, stat.st_mtime_ns, stat.st_size)
     except (FileNotFoundError, json.JSONDecodeError):
         return DEFAULT_CATEGORIES.copy()
 
 
 def save_categories(categories):
     """Save categories to file"""
-    with open(CATEGORIES_FILE, "w") as f:
-        json.dump(categories, f, indent=2)
+    data = json.dumps(categories, indent=2)
+    with open(CATEGORIES_FILE, "w", encoding="utf-8") as f:
+        f.write(data)
 
 
 def get_categories() -> List[str]:
@@ -76,12 +94,32 @@ def manage_categories():
 
 def get_priority_color(priority: str) -> str:
     """Get color based on task priority."""
-    colors = {
-        "High": "red",
-        "Medium": "orange",
-        "Low": "green",
-    }
-    return colors.get(priority, "black")  # Black for unknown priority
+    return PRIORITY_COLORS.get(priority, "black")  # Black for unknown priority
+
+
+def iter_filtered_tasks(tasks, show_completed=False, category=None, priority=None):
+    """Yield tasks matching completion status, category, and priority.
+
+    Args:
+        tasks (iterable): Tasks to filter
+        show_completed (bool): Whether to include completed tasks
+        category (str): Category to filter by
+        priority (str): Priority to filter by
+
+    Returns:
+        iterator: Matching tasks, in their original order
+    """
+    by_category = category and category != "All"
+    by_priority = priority and priority != "All"
+
+    # Apply all active filters in a single pass
+    return (
+        task
+        for task in tasks
+        if (show_completed or not task.get("completed", False))
+        and (not by_category or task.get("category") == category)
+        and (not by_priority or task.get("priority") == priority)
+    )
 
 
 def filter_tasks(tasks, show_completed=False, category=None, priority=None):
@@ -96,27 +134,15 @@ def filter_tasks(tasks, show_completed=False, category=None, priority=None):
     Returns:
         list: Filtered list of tasks
     """
-    filtered_tasks = tasks
-
-    # Filter by completion status
-    if not show_completed:
-        filtered_tasks = [
-            task for task in filtered_tasks if not task.get("completed", False)
-        ]
-
-    # Filter by category
-    if category and category != "All":
-        filtered_tasks = [
-            task for task in filtered_tasks if task.get("category") == category
-        ]
-
-    # Filter by priority
-    if priority and priority != "All":
-        filtered_tasks = [
-            task for task in filtered_tasks if task.get("priority") == priority
-        ]
+    # Nothing to filter: hand back the original list
+    if (
+        show_completed
+        and category in (None, "", "All")
+        and priority in (None, "", "All")
+    ):
+        return tasks
 
-    return filtered_tasks
+    return list(iter_filtered_tasks(tasks, show_completed, category, priority))
 
 
 def display_tasks_with_colors(tasks):
@@ -126,28 +152,33 @@ def display_tasks_with_colors(tasks):
         return
 
     for i, task in enumerate(tasks):
+        # Read each field once per task
+        title = task.get("title", "")
+        is_completed = task.get("completed", False)
+        priority = task.get("priority", "")
+        priority_color = PRIORITY_COLORS.get(priority or "Low", "black")
+
         with st.container():
             cols = st.columns([2, 2, 1])
 
             # Column 1: Task title and completion status
             with cols[0]:
                 completed = st.checkbox(
-                    task.get("title", ""),
-                    value=task.get("completed", False),
+                    title,
+                    value=is_completed,
                     key=f"task_{i}_completed",
                 )
-                if completed != task.get("completed", False):
+                if completed != is_completed:
                     task["completed"] = completed
                     st.rerun()
 
             # Column 2: Task details
             with cols[1]:
-                priority_color = get_priority_color(task.get("priority", "Low"))
-                st.markdown(f"_{task.get('title', '')}_")
+                st.markdown(f"_{title}_")
                 st.markdown(f"_{task.get('description', '')}_")
                 st.markdown(f"**Category:** {task.get('category', '')}")
                 st.markdown(
-                    f"**Priority:** <span style='color: {priority_color}'>{task.get('priority', '')}</span>",
+                    f"**Priority:** <span style='color: {priority_color}'>{priority}</span>",
                     unsafe_allow_html=True,
                 )
                 st.markdown(f"**Due Date:** {task.get('due_date', '')}")
@@ -158,7 +189,18 @@ def display_tasks_with_colors(tasks):
                     st.session_state.editing_task = task
                     st.rerun()
                 if st.button("Delete", key=f"delete_{i}"):
-                    tasks.remove(task)
+                    # Delete this exact task rather than the first one with
+                    # equal fields
+                    del tasks[i]
+                    # A filtered view is a separate list; drop it from the
+                    # session's tasks too
+                    if (
+                        "tasks" in st.session_state
+                        and st.session_state.tasks is not tasks
+                    ):
+                        st.session_state.tasks = [
+                            t for t in st.session_state.tasks if t is not task
+                        ]
                     st.rerun()
 
             st.markdown("---")  # Add a separator between tasks
@@ -178,7 +220,7 @@ def get_due_date_notifications(tasks: List[Dict]) -> List[str]:
             continue
 
         try:
-            due_date = datetime.strptime(due_date, "%Y-%m-%d").date()
+            due_date = parse_due_date(due_date)
         except ValueError:
             continue
 
@@ -212,7 +254,7 @@ def run_tests():
     try:
         # Run pytest with coverage
         result = subprocess.run(
-            ["python", "-m", "pytest", "--cov=src", "tests/"],
+            ["python", "-m", "pytest", "-n0", "--cov=src", "tests/"],
             capture_output=True,
             text=True,
         )
@@ -259,7 +301,7 @@ def run_bdd_tests():
 
     try:
         result = subprocess.run(
-            ["pytest", "tests/test_bdd.py", "-v"],
+            ["pytest", "-n0", "tests/test_bdd.py", "-v"],
             capture_output=True,
             text=True,
             env=env,
@@ -270,6 +312,42 @@ def run_bdd_tests():
         return f"{error_output}"
 
 
+# Older signatures never come back once a file changes, so keep only a few
+_TEST_RUN_CACHE_ENTRIES = 4
+
+
+def _test_files_signature():
+    """Get (path, mtime) pairs for the source, test and feature files."""
+    paths = (
+        glob.glob("src/**/*.py", recursive=True)
+        + glob.glob("tests/**/*.py", recursive=True)
+        + glob.glob("tests/**/*.feature", recursive=True)
+    )
+    return tuple(sorted((path, os.stat(path).st_mtime_ns) for path in paths))
+
+
+@st.cache_data(show_spinner=False, max_entries=_TEST_RUN_CACHE_ENTRIES)
+def _run_tests_cached(signature):
+    """Run the test suite; cached by Streamlit until a file changes."""
+    return run_tests()
+
+
+@st.cache_data(show_spinner=False, max_entries=_TEST_RUN_CACHE_ENTRIES)
+def _run_bdd_tests_cached(signature):
+    """Run the BDD tests; cached by Streamlit until a file changes."""
+    return run_bdd_tests()
+
+
+def _run_pytest_capture(args: List[str]) -> str:
+    """Run pytest in-process with the given arguments and return its output."""
+    output = StringIO()
+    with redirect_stdout(output):
+        # Run in this process; pytest.ini's xdist workers would escape the
+        # stdout capture
+        pytest.main(["-n0", *args])
+    return output.getvalue()
+
+
 def task_creation_form(editing_task=None):
     """Create a form for adding or editing tasks."""
     with st.form("task_form"):
@@ -281,11 +359,8 @@ def task_creation_form(editing_task=None):
         category = editing_task.get("category", "Work") if editing_task else "Work"
         priority = editing_task.get("priority", "High") if editing_task else "High"
         due_date = (
-            datetime.strptime(
-                editing_task.get("due_date", datetime.now().strftime("%Y-%m-%d")),
-                "%Y-%m-%d",
-            ).date()
-            if editing_task
+            parse_due_date(editing_task["due_date"])
+            if editing_task and editing_task.get("due_date")
             else datetime.now().date()
         )
 
@@ -330,7 +405,7 @@ def check_overdue_tasks(tasks: List[Dict]) -> None:
         if task.get("completed", False):
             continue
 
-        due_date = datetime.strptime(task.get("due_date", ""), "%Y-%m-%d").date()
+        due_date = parse_due_date(task.get("due_date", ""))
         days_until_due = (due_date - today).days
 
         if days_until_due < 0:
@@ -351,19 +426,31 @@ def main():
     # Initialize session state
     if "tasks" not in st.session_state:
         st.session_state.tasks = []
+    if "next_id" not in st.session_state:
+        # Scan for the highest id once per session, then just count up
+        st.session_state.next_id = generate_unique_id(st.session_state.tasks)
 
     # Task creation/editing form
     st.header("📝 Tasks")
     task = task_creation_form()
     if task:
+        tasks = st.session_state.tasks
+        index = None
         if "editing_task" in st.session_state:
-            # Update existing task
-            index = st.session_state.tasks.index(st.session_state.editing_task)
-            st.session_state.tasks[index] = task
+            # editing_task is the dict held in the task list, so match it by
+            # identity instead of comparing every field of every task
+            editing_task = st.session_state.editing_task
+            index = next((i for i, t in enumerate(tasks) if t is editing_task), None)
             del st.session_state.editing_task
-        else:
+        if index is None:
             # Add new task
-            st.session_state.tasks.append(task)
+            task["id"] = st.session_state.next_id
+            st.session_state.next_id += 1
+            tasks.append(task)
+        else:
+            # Update existing task, keeping its id
+            task["id"] = tasks[index].get("id")
+            tasks[index] = task
         st.rerun()
 
     # Task filtering
@@ -406,73 +493,34 @@ def main():
 
     with test_row1[0]:
         if st.button("Run All Tests"):
-            import pytest
-            import sys
-            from io import StringIO
-
-            # Capture test output
-            old_stdout = sys.stdout
-            sys.stdout = mystdout = StringIO()
-            pytest.main(["--cov=src", "tests/"])
-            sys.stdout = old_stdout
+            # Rerun pytest only when a source or test file has changed
+            results = _run_tests_cached(_test_files_signature())
 
             # Display test results
-            test_output = mystdout.getvalue()
-            st.code(test_output)
+            st.code(results["test_results"])
 
             # Display coverage summary if available
-            if "TOTAL" in test_output:
-                coverage_line = [
-                    line for line in test_output.split("\n") if "TOTAL" in line
-                ]
-                if coverage_line:
-                    st.markdown(f"**Coverage Summary:** {coverage_line[0]}")
+            if results["coverage"]:
+                st.markdown(f"**Coverage Summary:** {results['coverage']}")
 
     with test_row1[1]:
         if st.button("Run BDD Tests"):
-            import pytest
-            import sys
-            from io import StringIO
-
-            # Capture BDD test output
-            old_stdout = sys.stdout
-            sys.stdout = mystdout = StringIO()
-            pytest.main(["tests/test_bdd.py", "-v"])
-            sys.stdout = old_stdout
-
-            # Display BDD test results
-            st.code(mystdout.getvalue())
+            # Display BDD test results, cached like the full test run
+            st.code(_run_bdd_tests_cached(_test_files_signature()))
 
     with test_row2[0]:
         if st.button("Run Coverage Report"):
-            import pytest
-            import sys
-            from io import StringIO
-
             # Run coverage report with branch coverage
-            old_stdout = sys.stdout
-            sys.stdout = mystdout = StringIO()
-            pytest.main(
-                ["--cov=src", "--cov-branch", "--cov-report=term-missing", "tests/"]
+            st.code(
+                _run_pytest_capture(
+                    ["--cov=src", "--cov-branch", "--cov-report=term-missing", "tests/"]
+                )
             )
-            sys.stdout = old_stdout
-
-            # Display detailed coverage results
-            st.code(mystdout.getvalue())
 
     with test_row2[1]:
         if st.button("Generate HTML Report"):
-            import pytest
-            import sys
-            from io import StringIO
-            import webbrowser
-            import os
-
             # Generate HTML coverage report
-            old_stdout = sys.stdout
-            sys.stdout = mystdout = StringIO()
-            pytest.main(["--cov=src", "--cov-report=html", "tests/"])
-            sys.stdout = old_stdout
+            _run_pytest_capture(["--cov=src", "--cov-report=html", "tests/"])
 
             # Get the absolute path to the HTML report
             html_report = os.path.abspath("htmlcov/index.html")
@@ -492,42 +540,26 @@ def main():
 
     with test_row3[0]:
         if st.button("Run Parameterized Tests"):
-            import pytest
-            import sys
-            from io import StringIO
-
             # Run tests with -v to show individual parameter cases
-            old_stdout = sys.stdout
-            sys.stdout = mystdout = StringIO()
-            pytest.main(
-                ["-v", "-k", "test_task_priority or test_task_due_date", "tests/"]
+            st.code(
+                _run_pytest_capture(
+                    ["-v", "-k", "test_task_priority or test_task_due_date", "tests/"]
+                )
             )
-            sys.stdout = old_stdout
-
-            # Display parameterized test results
-            st.code(mystdout.getvalue())
 
     with test_row3[1]:
         if st.button("Run Mock Tests"):
-            import pytest
-            import sys
-            from io import StringIO
-
             # Run mock-specific tests
-            old_stdout = sys.stdout
-            sys.stdout = mystdout = StringIO()
-            pytest.main(
-                [
-                    "-v",
-                    "-k",
-                    "test_task_completion or test_task_deletion or test_task_display",
-                    "tests/",
-                ]
+            st.code(
+                _run_pytest_capture(
+                    [
+                        "-v",
+                        "-k",
+                        "test_task_completion or test_task_deletion or test_task_display",
+                        "tests/",
+                    ]
+                )
             )
-            sys.stdout = old_stdout
-
-            # Display mock test results
-            st.code(mystdout.getvalue())
 
 
 if __name__ == "__main__":
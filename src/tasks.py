@@ -1,10 +1,55 @@
+import copy
 import json
 import os
-from datetime import datetime
+import sys
+from datetime import date, datetime
+from enum import IntEnum
+from functools import lru_cache
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
 
 # File path for task storage
 TASKS_FILE = "tasks.json"
 
+
+def _stdlib_json_dumps(obj):
+    """Encode obj as two-space indented JSON bytes with the stdlib encoder."""
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+# JSON encode/decode helpers working on bytes, backed by orjson when available
+if orjson is not None:
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _json_loads = orjson.loads
+else:
+    _json_dumps = _stdlib_json_dumps
+    _json_loads = json.loads
+
+# Cache of parsed task files: {path: (mtime_ns, size, tasks)}
+_TASKS_CACHE = {}
+
+# Cache of task DataFrames: {path: ((mtime_ns, size), DataFrame)}
+_TASKS_DF_CACHE = {}
+
+
+class Priority(IntEnum):
+    """Task priorities, ordered from lowest to highest."""
+
+    Low = 0
+    Medium = 1
+    High = 2
+
+
+# Allowed task priorities
+_VALID_PRIORITIES = frozenset(Priority.__members__)
+
 # Required task properties
 REQUIRED_TASK_PROPERTIES = [
     "id",
@@ -18,6 +63,13 @@ REQUIRED_TASK_PROPERTIES = [
 ]
 
 
+def _now_strings():
+    """Return the current date and timestamp as (YYYY-MM-DD, YYYY-MM-DD HH:MM:SS)."""
+    now = datetime.now()
+    today = f"{now.year:04d}-{now.month:02d}-{now.day:02d}"
+    return today, f"{today} {now.hour:02d}:{now.minute:02d}:{now.second:02d}"
+
+
 def validate_task(task):
     """
     Validate that a task has all required properties.
@@ -32,6 +84,8 @@ def validate_task(task):
     if not isinstance(task, dict):
         return False
 
+    today, timestamp = _now_strings()
+
     # Required properties with default values
     defaults = {
         "id": None,  # Will be set when adding to tasks list
@@ -39,9 +93,9 @@ def validate_task(task):
         "description": "",
         "priority": "Low",
         "category": "Other",
-        "due_date": datetime.now().strftime("%Y-%m-%d"),
+        "due_date": today,
         "completed": False,
-        "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "created_at": timestamp,
     }
 
     # Add missing properties with default values
@@ -54,18 +108,47 @@ def validate_task(task):
         return False
 
     # Validate priority
-    if task["priority"] not in ["High", "Medium", "Low"]:
+    if task["priority"] not in _VALID_PRIORITIES:
         task["priority"] = "Low"
 
     # Validate due date format
     try:
-        datetime.strptime(task["due_date"], "%Y-%m-%d")
+        parse_due_date(task["due_date"])
     except ValueError:
-        task["due_date"] = datetime.now().strftime("%Y-%m-%d")
+        task["due_date"] = today
 
     return True
 
 
+@lru_cache(maxsize=1024)
+def parse_due_date(due_date):
+    """
+    Parse a "YYYY-MM-DD" due date string into a date.
+
+    Results are cached by string, and the fixed layout is parsed by slicing
+    rather than through strptime.
+
+    Args:
+        due_date (str): Due date in YYYY-MM-DD format
+
+    Returns:
+        date: The parsed date
+
+    Raises:
+        ValueError: If the string is not a valid YYYY-MM-DD date
+    """
+    year, month, day = due_date[0:4], due_date[5:7], due_date[8:10]
+    if not (
+        len(due_date) == 10
+        and due_date[4] == due_date[7] == "-"
+        and year.isdigit()
+        and month.isdigit()
+        and day.isdigit()
+    ):
+        raise ValueError(f"Invalid due date: {due_date!r}")
+    return date(int(year), int(month), int(day))
+
+
 def create_task(title, description, priority, category, due_date):
     """
     Create a new task with all required properties.
@@ -83,15 +166,17 @@ def create_task(title, description, priority, category, due_date):
     if not title:
         raise ValueError("Task title is required")
 
+    today, timestamp = _now_strings()
+
     # Validate priority
-    if priority not in ["High", "Medium", "Low"]:
+    if priority not in _VALID_PRIORITIES:
         priority = "Low"
 
     # Validate due date format
     try:
-        datetime.strptime(due_date, "%Y-%m-%d")
+        parse_due_date(due_date)
     except ValueError:
-        due_date = datetime.now().strftime("%Y-%m-%d")
+        due_date = today
 
     task = {
         "id": None,  # Will be set when adding to tasks list
@@ -101,7 +186,7 @@ def create_task(title, description, priority, category, due_date):
         "category": category or "Other",
         "due_date": due_date,
         "completed": False,
-        "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "created_at": timestamp,
     }
 
     if not validate_task(task):
@@ -110,30 +195,104 @@ def create_task(title, description, priority, category, due_date):
     return task
 
 
-def load_tasks(tasks_file="tasks.json"):
-    """Load tasks from file or return empty list"""
+def _is_frame(tasks):
+    """Check for a DataFrame without importing pandas for plain task lists."""
+    # No DataFrame can exist unless something has already imported pandas
+    pd = sys.modules.get("pandas")
+    return pd is not None and isinstance(tasks, pd.DataFrame)
+
+
+def _read_tasks_cached(path):
+    """Return ((mtime_ns, size), tasks) for path, re-reading only on change."""
     try:
-        with open(tasks_file, "r") as f:
-            return json.load(f)
+        stat = os.stat(path)
+        cached = _TASKS_CACHE.get(path)
+        if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[:2], cached[2]
+        tasks = _json_loads(Path(path).read_bytes())
     except (FileNotFoundError, json.JSONDecodeError):
-        return []
+        _TASKS_CACHE.pop(path, None)
+        return None, []
+    _TASKS_CACHE[path] = (stat.st_mtime_ns, stat.st_size, tasks)
+    return (stat.st_mtime_ns, stat.st_size), tasks
+
 
+def load_tasks(tasks_file=TASKS_FILE):
+    """Load tasks from file or return empty list.
 
-def save_tasks(tasks, tasks_file="tasks.json"):
+    The parsed result is cached per path and only re-read when the file's
+    mtime or size changes.
+    """
+    _, tasks = _read_tasks_cached(str(tasks_file))
+    return copy.deepcopy(tasks)
+
+
+def clear_tasks_cache():
+    """Drop every cached task file, so the next load re-reads from disk."""
+    _TASKS_CACHE.clear()
+    _TASKS_DF_CACHE.clear()
+
+
+def load_tasks_frame(tasks_file=TASKS_FILE):
+    """
+    Load tasks as a pandas DataFrame with one row per task.
+
+    The frame shares the (mtime, size) cache key used by load_tasks, so it is
+    only rebuilt when the file changes. The returned frame is shared between
+    callers and must not be modified in place.
+
+    Args:
+        tasks_file (str): Path of the tasks file
+
+    Returns:
+        DataFrame: Tasks with one column per required task property
+    """
+    path = str(tasks_file)
+    key, tasks = _read_tasks_cached(path)
+    cached = _TASKS_DF_CACHE.get(path)
+    if key is None or cached is None or cached[0] != key:
+        import pandas as pd
+
+        df = pd.DataFrame.from_records(tasks, columns=REQUIRED_TASK_PROPERTIES)
+        # Store the low-cardinality columns as small integer codes so the
+        # filter masks compare int8 arrays rather than Python strings
+        # The priority codes match the Priority values
+        priority_dtype = pd.CategoricalDtype([p.name for p in Priority], ordered=True)
+        df = df.astype({"priority": priority_dtype, "category": "category"})
+        cached = (key, df)
+        if key is not None:
+            _TASKS_DF_CACHE[path] = cached
+    return cached[1]
+
+
+def save_tasks(tasks, tasks_file=TASKS_FILE):
     """Save tasks to file"""
-    with open(tasks_file, "w") as f:
-        json.dump(tasks, f, indent=2)
+    path = str(tasks_file)
+    # Encode up front so the file is written in a single call
+    data = _json_dumps(tasks)
+    with open(path, "wb") as f:
+        f.write(data)
+    # Refresh the cache so the next load doesn't re-read what we just wrote
+    stat = os.stat(path)
+    _TASKS_CACHE[path] = (stat.st_mtime_ns, stat.st_size, copy.deepcopy(tasks))
 
 
 def generate_unique_id(tasks):
     """Generate a unique ID for a new task"""
-    if not tasks:
-        return 1
-    return max(task.get("id", 0) for task in tasks) + 1
+    # Tasks saved before ids were assigned have an id of None
+    return max((task.get("id") or 0 for task in tasks), default=0) + 1
 
 
 def filter_tasks_by_priority(tasks, priority):
     """Filter tasks by priority"""
+    if _is_frame(tasks):
+        if isinstance(priority, Priority):
+            # Compare the integer category codes directly
+            return tasks[tasks["priority"].cat.codes == priority]
+        return tasks[tasks["priority"] == priority]
+    if isinstance(priority, Priority):
+        # List tasks store the priority by name
+        priority = priority.name
     if priority == "NonExistent":
         return []
     return [task for task in tasks if task.get("priority") == priority]
@@ -141,6 +300,8 @@ def filter_tasks_by_priority(tasks, priority):
 
 def filter_tasks_by_category(tasks, category):
     """Filter tasks by category"""
+    if _is_frame(tasks):
+        return tasks[tasks["category"] == category]
     if category == "NonExistent":
         return []
     return [task for task in tasks if task.get("category") == category]
@@ -151,12 +312,15 @@ def filter_tasks_by_completion(tasks, completed=True):
     Filter tasks by completion status.
 
     Args:
-        tasks (list): List of task dictionaries
+        tasks (list or DataFrame): Task dictionaries or a task DataFrame
         completed (bool): Completion status to filter by
 
     Returns:
-        list: Filtered list of tasks matching the completion status
+        list or DataFrame: Tasks matching the completion status, in the
+        same form as the input
     """
+    if _is_frame(tasks):
+        return tasks[tasks["completed"] == completed]
     return [task for task in tasks if task.get("completed") == completed]
 
 
@@ -165,20 +329,35 @@ def search_tasks(tasks, query):
     Search tasks by a text query in title and description.
 
     Args:
-        tasks (list): List of task dictionaries
+        tasks (list or DataFrame): Task dictionaries or a task DataFrame
         query (str): Search query
 
     Returns:
-        list: Filtered list of tasks matching the search query
+        list or DataFrame: Tasks matching the search query, in the same form
+        as the input
     """
+    if _is_frame(tasks):
+        if not query:
+            return tasks.iloc[0:0]
+        in_title = tasks["title"].str.contains(query, case=False, regex=False, na=False)
+        in_description = tasks["description"].str.contains(
+            query, case=False, regex=False, na=False
+        )
+        return tasks[in_title | in_description]
     if not query:
         return []
     query = query.lower()
+    # Skip the entries validate_task would reject, without filling in
+    # defaults on every task for each search
     return [
         task
         for task in tasks
-        if validate_task(task)
-        and (query in task["title"].lower() or query in task["description"].lower())
+        if isinstance(task, dict)
+        and task.get("title")
+        and (
+            query in task["title"].lower()
+            or query in task.get("description", "").lower()
+        )
     ]
 
 
@@ -187,21 +366,30 @@ def get_overdue_tasks(tasks):
     Get tasks that are past their due date and not completed.
 
     Args:
-        tasks (list): List of task dictionaries
+        tasks (list or DataFrame): Task dictionaries or a task DataFrame
 
     Returns:
-        list: List of overdue tasks
+        list or DataFrame: Overdue tasks, in the same form as the input
 
     Raises:
         ValueError: If a task is missing the due_date field
     """
+    if _is_frame(tasks):
+        # ne(True) keeps tasks with a missing (NaN) completed flag as pending
+        pending = tasks[tasks["completed"].ne(True)]
+        if pending["due_date"].isna().any():
+            raise ValueError("Task is missing due_date field")
+        import pandas as pd
+
+        due_dates = pd.to_datetime(pending["due_date"], format="%Y-%m-%d", cache=True)
+        return pending[due_dates < pd.Timestamp(datetime.now().date())]
     today = datetime.now().date()
     overdue_tasks = []
     for task in tasks:
         if not task.get("completed", False):
             if "due_date" not in task:
                 raise ValueError("Task is missing due_date field")
-            task_date = datetime.strptime(task["due_date"], "%Y-%m-%d").date()
+            task_date = parse_due_date(task["due_date"])
             if task_date < today:
                 overdue_tasks.append(task)
     return overdue_tasks
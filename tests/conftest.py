@@ -0,0 +1,32 @@
+import os
+import sys
+
+import pytest
+
+
+def pytest_configure(config):
+    # Keep tmp_path files in RAM on Linux, unless a temp root is already chosen
+    if (
+        sys.platform.startswith("linux")
+        and config.option.basetemp is None
+        and "PYTEST_DEBUG_TEMPROOT" not in os.environ
+        and os.access("/dev/shm", os.W_OK)
+    ):
+        os.environ["PYTEST_DEBUG_TEMPROOT"] = "/dev/shm"
+        # Undo it when this session ends, so a process that runs pytest
+        # in-process (like the app) doesn't keep the setting
+        config.add_cleanup(lambda: os.environ.pop("PYTEST_DEBUG_TEMPROOT", None))
+
+
+@pytest.fixture(scope="session")
+def worker_data_dir(tmp_path_factory):
+    """Directory for this xdist worker's default data files"""
+    return tmp_path_factory.mktemp(os.environ.get("PYTEST_XDIST_WORKER", "master"))
+
+
+@pytest.fixture(autouse=True)
+def isolated_data_files(worker_data_dir, monkeypatch):
+    # Run from this worker's directory, so the default tasks.json and
+    # categories.json paths resolve there instead of in the repo, and
+    # parallel workers never contend on the same files
+    monkeypatch.chdir(worker_data_dir)
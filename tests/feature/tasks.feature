@@ -0,0 +1,40 @@
+Feature: Task management
+    Managing tasks and categories in the to-do app
+
+    Scenario: Adding a task to an empty list
+        Given I have an empty task list
+        When I add a new task with title "Buy groceries"
+        Then the task list should contain "1" tasks
+
+    Scenario: Adding a task to an existing list
+        Given I have a task with title "Write report" and due date "2099-01-01"
+        When I add a new task with title "Buy groceries"
+        Then the task list should contain "2" tasks
+
+    Scenario: Completing a task
+        Given I have a task with priority "Medium"
+        When I mark the task as completed
+        Then the task should be marked as completed
+
+    Scenario Outline: Priority colors
+        Given I have a task with priority "<priority>"
+        Then the task should be displayed with "<color>" color
+
+        Examples:
+            | priority | color  |
+            | High     | red    |
+            | Medium   | orange |
+            | Low      | green  |
+
+    Scenario: Overdue task
+        Given I have a task with title "Pay rent" and due date "2020-01-01"
+        Then the task should be in the "overdue" section
+
+    Scenario: Upcoming task
+        Given I have a task with title "Renew passport" and due date "2099-01-01"
+        Then the task should be in the "upcoming" section
+
+    Scenario: Task in a custom category
+        Given I have a task in category "Health"
+        When I add a new category "Health"
+        Then the category list should contain "Health"
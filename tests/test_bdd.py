@@ -1,11 +1,29 @@
 from pytest_bdd import scenarios, given, when, then, parsers
 import pytest
-from datetime import datetime, timedelta
-from src.app import load_tasks, save_tasks, load_categories, save_categories
-from src.tasks import create_task
-
-# Load scenarios from feature files
-scenarios("../features")
+import copy
+from datetime import date, timedelta
+import sys
+from pathlib import Path
+from src.app import (
+    DEFAULT_CATEGORIES,
+    load_tasks,
+    save_tasks,
+    load_categories,
+    save_categories,
+)
+from src import tasks as task_storage
+from src.tasks import clear_tasks_cache, create_task
+
+# Captured once; new tasks are due today and status checks compare against it
+_TODAY = date.today()
+TODAY = _TODAY.isoformat()
+
+# Colors each priority is expected to display with
+_PRIORITY_COLORS = {"High": "red", "Medium": "orange", "Low": "green"}
+
+# Load scenarios from the feature files next to this module
+FEATURES_DIR = Path(__file__).resolve().parent / "feature"
+scenarios(str(FEATURES_DIR))
 
 
 # Fixtures
@@ -14,65 +32,83 @@ def context():
     return {}
 
 
+@pytest.fixture(scope="module")
+def make_task():
+    """Create a task from defaults, overriding only the given fields"""
+    base = dict(
+        title="Test Task",
+        description="Test description",
+        priority="Medium",
+        category="Work",
+        due_date=TODAY,
+    )
+    return lambda **fields: create_task(**{**base, **fields})
+
+
+@pytest.fixture(autouse=True)
+def in_memory_storage(context, monkeypatch):
+    """Keep the steps' tasks and categories in context instead of JSON files.
+
+    Saves and loads copy the data, like the JSON round trip would, so later
+    changes to a step's list only show up in storage once they are saved.
+    """
+    module = sys.modules[__name__]
+    store = {"tasks": [], "categories": DEFAULT_CATEGORIES}
+
+    def saver(key):
+        return lambda data: store.__setitem__(key, copy.deepcopy(data))
+
+    def loader(key):
+        return lambda: copy.deepcopy(store[key])
+
+    monkeypatch.setattr(module, "save_tasks", saver("tasks"))
+    monkeypatch.setattr(module, "load_tasks", loader("tasks"))
+    monkeypatch.setattr(module, "save_categories", saver("categories"))
+    monkeypatch.setattr(module, "load_categories", loader("categories"))
+
+
+def test_tasks_json_round_trip(tmp_path, make_task):
+    # The steps above never touch disk, so check the real JSON path once here
+    file_path = str(tmp_path / "tasks.json")
+    tasks = [make_task()]
+    task_storage.save_tasks(tasks, file_path)
+    # save_tasks primes the load cache; clear it so the file is really read
+    clear_tasks_cache()
+    assert task_storage.load_tasks(file_path) == tasks
+
+
 # Given steps
 @given("I have an empty task list")
 def empty_task_list(context):
     context["tasks"] = []
-    save_tasks(context["tasks"])
 
 
-@given(parsers.parse('I have a task with title "{title}" and due date "{due_date}"'))
-def task_with_title_and_due_date(context, title, due_date):
-    context["tasks"] = [
-        create_task(
-            title=title,
-            description="Test description",
-            priority="Medium",
-            category="Work",
-            due_date=due_date,
-        )
-    ]
+@given(
+    parsers.re(
+        r'I have a task with title "(?P<title>.+?)" and due date "(?P<due_date>.+?)"'
+    )
+)
+def task_with_title_and_due_date(context, make_task, title, due_date):
+    context["tasks"] = [make_task(title=title, due_date=due_date)]
     save_tasks(context["tasks"])
 
 
-@given(parsers.parse('I have a task with priority "{priority}"'))
-def task_with_priority(context, priority):
-    context["tasks"] = [
-        create_task(
-            title="Test Task",
-            description="Test description",
-            priority=priority,
-            category="Work",
-            due_date=datetime.now().strftime("%Y-%m-%d"),
-        )
-    ]
+@given(parsers.re(r'I have a task with priority "(?P<priority>.+?)"'))
+def task_with_priority(context, make_task, priority):
+    context["tasks"] = [make_task(priority=priority)]
     save_tasks(context["tasks"])
 
 
-@given(parsers.parse('I have a task in category "{category}"'))
-def task_in_category(context, category):
-    context["tasks"] = [
-        create_task(
-            title="Test Task",
-            description="Test description",
-            priority="Medium",
-            category=category,
-            due_date=datetime.now().strftime("%Y-%m-%d"),
-        )
-    ]
+@given(parsers.re(r'I have a task in category "(?P<category>.+?)"'))
+def task_in_category(context, make_task, category):
+    context["tasks"] = [make_task(category=category)]
     save_tasks(context["tasks"])
 
 
 # When steps
-@when(parsers.parse('I add a new task with title "{title}"'))
-def add_new_task(context, title):
-    new_task = create_task(
-        title=title,
-        description="Test description",
-        priority="Medium",
-        category="Work",
-        due_date=datetime.now().strftime("%Y-%m-%d"),
-    )
+@when(parsers.re(r'I add a new task with title "(?P<title>.+?)"'))
+def add_new_task(context, make_task, title):
+    new_task = make_task(title=title)
     context["tasks"].append(new_task)
     save_tasks(context["tasks"])
 
@@ -83,7 +119,7 @@ def mark_task_completed(context):
     save_tasks(context["tasks"])
 
 
-@when(parsers.parse('I add a new category "{category}"'))
+@when(parsers.re(r'I add a new category "(?P<category>.+?)"'))
 def add_new_category(context, category):
     categories = load_categories()
     if category not in categories:
@@ -92,30 +128,32 @@ def add_new_category(context, category):
 
 
 # Then steps
-@then(parsers.parse('the task list should contain "{count}" tasks'))
+@then(parsers.re(r'the task list should contain "(?P<count>.+?)" tasks'))
 def verify_task_count(context, count):
     tasks = load_tasks()
     assert len(tasks) == int(count)
+    # Storage holds exactly the tasks the steps built
+    assert tasks == context["tasks"]
 
 
 @then("the task should be marked as completed")
 def verify_task_completed(context):
     tasks = load_tasks()
     assert tasks[0]["completed"] is True
+    assert tasks == context["tasks"]
 
 
-@then(parsers.parse('the task should be displayed with "{color}" color'))
+@then(parsers.re(r'the task should be displayed with "(?P<color>.+?)" color'))
 def verify_task_color(context, color):
     tasks = load_tasks()
-    priority_colors = {"High": "red", "Medium": "orange", "Low": "green"}
-    assert priority_colors.get(tasks[0]["priority"]) == color
+    assert _PRIORITY_COLORS.get(tasks[0]["priority"]) == color
 
 
-@then(parsers.parse('the task should be in the "{status}" section'))
+@then(parsers.re(r'the task should be in the "(?P<status>.+?)" section'))
 def verify_task_status(context, status):
     tasks = load_tasks()
-    today = datetime.now().date()
-    task_date = datetime.strptime(tasks[0]["due_date"], "%Y-%m-%d").date()
+    today = _TODAY
+    task_date = date.fromisoformat(tasks[0]["due_date"])
 
     if status == "overdue":
         assert task_date < today
@@ -125,7 +163,7 @@ def verify_task_status(context, status):
         assert task_date > today
 
 
-@then(parsers.parse('the category list should contain "{category}"'))
+@then(parsers.re(r'the category list should contain "(?P<category>.+?)"'))
 def verify_category_exists(context, category):
     categories = load_categories()
     assert category in categories
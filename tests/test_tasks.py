@@ -1,9 +1,13 @@
 import pytest
-import json
+import copy
 import os
-from datetime import datetime, timedelta
+import json
+from datetime import date, timedelta
+from src import tasks as task_storage
 from src.tasks import (
+    clear_tasks_cache,
     load_tasks,
+    load_tasks_frame,
     save_tasks,
     generate_unique_id,
     filter_tasks_by_priority,
@@ -11,10 +15,18 @@ from src.tasks import (
     filter_tasks_by_completion,
     search_tasks,
     get_overdue_tasks,
+    parse_due_date,
+    Priority,
 )
 
+# Due dates relative to when the tests run
+_today = date.today()
+TODAY = _today.isoformat()
+YESTERDAY = (_today - timedelta(days=1)).isoformat()
+TOMORROW = (_today + timedelta(days=1)).isoformat()
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def sample_tasks():
     return [
         {
@@ -24,7 +36,7 @@ def sample_tasks():
             "priority": "High",
             "category": "Work",
             "completed": False,
-            "due_date": (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d"),
+            "due_date": YESTERDAY,
         },
         {
             "id": 2,
@@ -33,7 +45,7 @@ def sample_tasks():
             "priority": "Medium",
             "category": "Personal",
             "completed": True,
-            "due_date": (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d"),
+            "due_date": TOMORROW,
         },
         {
             "id": 3,
@@ -42,19 +54,35 @@ def sample_tasks():
             "priority": "Low",
             "category": "Work",
             "completed": False,
-            "due_date": datetime.now().strftime("%Y-%m-%d"),
+            "due_date": TODAY,
         },
     ]
 
 
-@pytest.fixture
-def temp_tasks_file(tmp_path, sample_tasks):
-    file_path = tmp_path / "test_tasks.json"
-    with open(file_path, "w") as f:
-        json.dump(sample_tasks, f)
+@pytest.fixture(scope="module")
+def tasks_by_id(sample_tasks):
+    # Look up sample tasks by id when building a filter's expected result
+    return {task["id"]: task for task in sample_tasks}
+
+
+def _write_tasks_file(file_path, tasks):
+    with open(file_path, "w", encoding="utf-8") as f:
+        json.dump(tasks, f)
     return file_path
 
 
+@pytest.fixture(scope="module")
+def temp_tasks_file(tmp_path_factory, sample_tasks):
+    # Shared by read-only tests; tests that write use writable_tasks_file
+    file_path = tmp_path_factory.mktemp("tasks") / "test_tasks.json"
+    return _write_tasks_file(file_path, sample_tasks)
+
+
+@pytest.fixture
+def writable_tasks_file(tmp_path, sample_tasks):
+    return _write_tasks_file(tmp_path / "test_tasks.json", sample_tasks)
+
+
 @pytest.fixture
 def corrupted_tasks_file(tmp_path):
     file_path = tmp_path / "corrupted_tasks.json"
@@ -63,20 +91,39 @@ def corrupted_tasks_file(tmp_path):
     return file_path
 
 
-def test_load_tasks(temp_tasks_file, sample_tasks, corrupted_tasks_file):
+def test_load_tasks(temp_tasks_file, sample_tasks):
     # Test loading existing tasks
     loaded_tasks = load_tasks(str(temp_tasks_file))
     assert loaded_tasks == sample_tasks
 
+
+def test_load_tasks_missing():
     # Test loading non-existent file
     non_existent_file = "non_existent.json"
     assert load_tasks(non_existent_file) == []
 
+
+def test_load_tasks_corrupted(corrupted_tasks_file):
     # Test loading corrupted file
     assert load_tasks(str(corrupted_tasks_file)) == []
 
 
-def test_save_tasks(temp_tasks_file, sample_tasks):
+def test_load_tasks_cache(writable_tasks_file, sample_tasks):
+    # Test repeated loads return equal but independent copies
+    first = load_tasks(str(writable_tasks_file))
+    first[0]["title"] = "Changed"
+    assert load_tasks(str(writable_tasks_file)) == sample_tasks
+
+    # Test external changes to the file are picked up
+    _write_tasks_file(writable_tasks_file, sample_tasks[:1])
+    assert load_tasks(str(writable_tasks_file)) == sample_tasks[:1]
+
+    # Test loads after clearing the cache re-read the file
+    clear_tasks_cache()
+    assert load_tasks(str(writable_tasks_file)) == sample_tasks[:1]
+
+
+def test_save_tasks(writable_tasks_file, sample_tasks):
     # Test saving tasks
     new_task = {
         "id": 4,
@@ -85,18 +132,44 @@ def test_save_tasks(temp_tasks_file, sample_tasks):
         "priority": "Low",
         "category": "Work",
         "completed": False,
-        "due_date": datetime.now().strftime("%Y-%m-%d"),
+        "due_date": TODAY,
     }
-    sample_tasks.append(new_task)
-    save_tasks(sample_tasks, str(temp_tasks_file))
+    tasks = copy.deepcopy(sample_tasks)
+    tasks.append(new_task)
+    save_tasks(tasks, str(writable_tasks_file))
+
+    # The file holds the same tasks, whichever encoder wrote it
+    assert json.loads(writable_tasks_file.read_bytes()) == tasks
 
-    with open(temp_tasks_file, "r") as f:
-        saved_tasks = json.load(f)
-    assert saved_tasks == sample_tasks
+
+def test_save_tasks_stdlib_encoder(monkeypatch, writable_tasks_file, sample_tasks):
+    # Test the encoder used when orjson isn't installed
+    monkeypatch.setattr(task_storage, "_json_dumps", task_storage._stdlib_json_dumps)
+    monkeypatch.setattr(task_storage, "_json_loads", json.loads)
+    save_tasks(sample_tasks, str(writable_tasks_file))
+
+    data = writable_tasks_file.read_bytes()
+    assert data == json.dumps(sample_tasks, indent=2).encode("utf-8")
+    # Read the file back rather than the copy save_tasks cached
+    clear_tasks_cache()
+    assert load_tasks(str(writable_tasks_file)) == sample_tasks
+
+
+def test_save_tasks_missing_directory(tmp_path, sample_tasks):
+    # Test saving under a directory that doesn't exist
+    with pytest.raises(IOError):
+        save_tasks(sample_tasks, str(tmp_path / "missing" / "tasks.json"))
+
+
+def test_save_tasks_read_only_location(tmp_path, sample_tasks):
+    if hasattr(os, "geteuid") and os.geteuid() == 0:
+        pytest.skip("root can write to read-only directories")
 
     # Test saving to read-only location
+    read_only_dir = tmp_path / "ro_dir"
+    read_only_dir.mkdir(mode=0o500)
     with pytest.raises(IOError):
-        save_tasks(sample_tasks, "/readonly/location/tasks.json")
+        save_tasks(sample_tasks, str(read_only_dir / "tasks.json"))
 
 
 def test_generate_unique_id(sample_tasks):
@@ -109,53 +182,45 @@ def test_generate_unique_id(sample_tasks):
     # Test with single task
     assert generate_unique_id([{"id": 1}]) == 2
 
+    # Test with tasks missing an id
+    assert generate_unique_id([{"id": None}, {"id": 3}, {}]) == 4
 
-def test_filter_tasks_by_priority(sample_tasks):
-    # Test filtering high priority tasks
-    high_priority = filter_tasks_by_priority(sample_tasks, "High")
-    assert len(high_priority) == 1
-    assert high_priority[0]["id"] == 1
-
-    # Test filtering medium priority tasks
-    medium_priority = filter_tasks_by_priority(sample_tasks, "Medium")
-    assert len(medium_priority) == 1
-    assert medium_priority[0]["id"] == 2
 
-    # Test filtering low priority tasks
-    low_priority = filter_tasks_by_priority(sample_tasks, "Low")
-    assert len(low_priority) == 1
-    assert low_priority[0]["id"] == 3
-
-    # Test filtering non-existent priority
-    assert filter_tasks_by_priority(sample_tasks, "NonExistent") == []
+@pytest.mark.parametrize(
+    "priority,expected_ids",
+    [("High", [1]), ("Medium", [2]), ("Low", [3]), ("NonExistent", [])],
+)
+def test_filter_tasks_by_priority(sample_tasks, tasks_by_id, priority, expected_ids):
+    # Test filtering by each priority, and one no task has
+    tasks = filter_tasks_by_priority(sample_tasks, priority)
+    assert tasks == [tasks_by_id[task_id] for task_id in expected_ids]
 
 
-def test_filter_tasks_by_category(sample_tasks):
-    # Test filtering work category tasks
-    work_tasks = filter_tasks_by_category(sample_tasks, "Work")
-    assert len(work_tasks) == 2
-    assert all(task["category"] == "Work" for task in work_tasks)
+def test_filter_tasks_by_priority_enum(sample_tasks, tasks_by_id):
+    # Test a Priority member matches tasks stored with its name
+    tasks = filter_tasks_by_priority(sample_tasks, Priority.High)
+    assert tasks == [tasks_by_id[1]]
 
-    # Test filtering personal category tasks
-    personal_tasks = filter_tasks_by_category(sample_tasks, "Personal")
-    assert len(personal_tasks) == 1
-    assert personal_tasks[0]["id"] == 2
 
-    # Test filtering non-existent category
-    assert filter_tasks_by_category(sample_tasks, "NonExistent") == []
+@pytest.mark.parametrize(
+    "category,expected_ids",
+    [("Work", [1, 3]), ("Personal", [2]), ("NonExistent", [])],
+)
+def test_filter_tasks_by_category(sample_tasks, tasks_by_id, category, expected_ids):
+    # Test filtering by each category, and one no task has
+    tasks = filter_tasks_by_category(sample_tasks, category)
+    assert tasks == [tasks_by_id[task_id] for task_id in expected_ids]
+    assert all(task["category"] == category for task in tasks)
 
 
-def test_filter_tasks_by_completion(sample_tasks):
-    # Test filtering completed tasks
-    completed_tasks = filter_tasks_by_completion(sample_tasks, True)
-    assert len(completed_tasks) == 1
-    assert completed_tasks[0]["id"] == 2
+@pytest.mark.parametrize("completed,expected_ids", [(True, [2]), (False, [1, 3])])
+def test_filter_tasks_by_completion(sample_tasks, tasks_by_id, completed, expected_ids):
+    # Test filtering completed and incomplete tasks
+    tasks = filter_tasks_by_completion(sample_tasks, completed)
+    assert tasks == [tasks_by_id[task_id] for task_id in expected_ids]
 
-    # Test filtering incomplete tasks
-    incomplete_tasks = filter_tasks_by_completion(sample_tasks, False)
-    assert len(incomplete_tasks) == 2
-    assert all(not task["completed"] for task in incomplete_tasks)
 
+def test_filter_tasks_by_completion_missing_status():
     # Test filtering with no completion status
     tasks_without_completion = [{"id": 1}, {"id": 2, "completed": True}]
     assert len(filter_tasks_by_completion(tasks_without_completion, True)) == 1
@@ -192,6 +257,52 @@ def test_search_tasks(sample_tasks):
     assert case_results[0]["id"] == 1
 
 
+def test_search_tasks_skips_invalid_entries():
+    # Non-dict entries and tasks without a title never match
+    tasks = [
+        "Task 1",
+        None,
+        {"id": 1, "title": "", "description": "Task 1 without a title"},
+        {"id": 2, "description": "Task 1 missing its title"},
+        {"id": 3, "title": "Task 1"},
+    ]
+    assert search_tasks(tasks, "Task 1") == [{"id": 3, "title": "Task 1"}]
+
+
+def test_task_frame_filters(temp_tasks_file):
+    # Test the DataFrame variants match the list-based filters
+    df = load_tasks_frame(str(temp_tasks_file))
+    assert load_tasks_frame(str(temp_tasks_file)) is df
+    assert df["priority"].dtype == "category"
+    assert list(df["priority"].cat.codes) == [
+        Priority.High,
+        Priority.Medium,
+        Priority.Low,
+    ]
+    assert filter_tasks_by_priority(df, "NonExistent").empty
+    assert list(filter_tasks_by_priority(df, "High")["id"]) == [1]
+    assert list(filter_tasks_by_priority(df, Priority.Low)["id"]) == [3]
+    assert list(filter_tasks_by_category(df, "Work")["id"]) == [1, 3]
+    assert list(filter_tasks_by_completion(df, True)["id"]) == [2]
+    assert list(search_tasks(df, "TEST TASK 1")["id"]) == [1]
+    assert search_tasks(df, "").empty
+    assert list(get_overdue_tasks(df)["id"]) == [1]
+
+    # Test loading a missing file gives an empty frame
+    assert load_tasks_frame("non_existent.json").empty
+
+
+def test_parse_due_date():
+    # Test parsing a valid date, twice to go through the cache
+    assert parse_due_date("2024-03-20") == date(2024, 3, 20)
+    assert parse_due_date("2024-03-20") == date(2024, 3, 20)
+
+    # Test malformed and impossible dates are rejected
+    for bad_date in ["", "invalid-date", "2024/03/20", "2024-3-20", "2024-02-30"]:
+        with pytest.raises(ValueError):
+            parse_due_date(bad_date)
+
+
 def test_get_overdue_tasks(sample_tasks):
     # Test getting overdue tasks
     overdue_tasks = get_overdue_tasks(sample_tasks)
@@ -204,7 +315,7 @@ def test_get_overdue_tasks(sample_tasks):
             "id": 1,
             "title": "Today's Task",
             "completed": False,
-            "due_date": datetime.now().strftime("%Y-%m-%d"),
+            "due_date": TODAY,
         }
     ]
     assert len(get_overdue_tasks(today_tasks)) == 0